@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future
+import asyncio
+import os
+import threading
 
 import pytest
 
-from ._loader import DuplicatePolicy, ManifestIndex, load_manifest
+from ._loader import (
+    DuplicatePolicy,
+    ManifestIndex,
+    _run_helm_async,
+    load_manifest,
+    parse_manifest_documents,
+)
+
+_RenderKey = tuple[tuple[str, ...], DuplicatePolicy]
+
+# Fixture name -> render keys, populated as `manifest_fixture` is called. A
+# name can have several keys when conftests in different directories
+# override the same fixture with their own commands.
+_REGISTRY: dict[str, set[_RenderKey]] = {}
+# Render key -> in-flight or finished render, shared by every fixture with the
+# same command for the rest of the session.
+_PREFETCHED: dict[_RenderKey, Future[ManifestIndex]] = {}
 
 
 def manifest_fixture(
@@ -18,6 +38,10 @@ def manifest_fixture(
     """
     Create a named pytest fixture that returns a parsed Helm manifest index.
 
+    Helm runs at most once per distinct command and duplicate policy in a
+    session, and fixtures sharing a command receive the same index, so tests
+    should treat the returned manifests as read-only.
+
     Example:
         default_manifest = manifest_fixture(
             "default_manifest",
@@ -27,14 +51,100 @@ def manifest_fixture(
     if not isinstance(name, str) or not name:
         raise ValueError("Fixture name must be a non-empty string.")
 
-    command = tuple(command)
+    try:
+        command = tuple(command)
+    except TypeError:
+        raise ValueError("Helm command must be a non-empty sequence of strings.") from None
     if not command:
         raise ValueError("Helm command must be a non-empty sequence of strings.")
-    if not all(isinstance(part, str) and part for part in command):
-        raise ValueError("Helm command must contain only non-empty strings.")
+    for part in command:
+        if not (isinstance(part, str) and part):
+            raise ValueError("Helm command must contain only non-empty strings.")
+
+    key: _RenderKey = (command, on_duplicate)
+    _REGISTRY.setdefault(name, set()).add(key)
 
     @pytest.fixture(name=name, scope="session")
     def _manifest_fixture() -> ManifestIndex:
-        return load_manifest(command, on_duplicate=on_duplicate)
+        future = _PREFETCHED.get(key)
+        if future is None:
+            future = Future()
+            try:
+                future.set_result(load_manifest(command, on_duplicate=on_duplicate))
+            except Exception as exc:
+                future.set_exception(exc)
+            _PREFETCHED[key] = future
+        return future.result()
 
     return _manifest_fixture
+
+
+def prefetch_manifests(fixture_names: Iterable[str]) -> None:
+    """Start rendering the given registered fixtures concurrently.
+
+    Each distinct command is rendered once; all renders share a single event
+    loop on a background thread, and the fixtures wait on their results
+    instead of invoking Helm serially. A name overridden in several conftests
+    starts a render for every definition. Names that were not created with
+    `manifest_fixture` are ignored.
+    """
+    keys = {key for name in fixture_names for key in _REGISTRY.get(name, ())}
+    keys.difference_update(_PREFETCHED)
+    if not keys:
+        return
+
+    futures: dict[_RenderKey, Future[ManifestIndex]] = {key: Future() for key in keys}
+    _PREFETCHED.update(futures)
+    # Tests start while renders are still launching and may chdir or setenv,
+    # so pin every render to the directory and environment of this call.
+    cwd = os.getcwd()
+    env = dict(os.environ)
+    threading.Thread(
+        target=asyncio.run,
+        args=(_render_all(futures, cwd=cwd, env=env),),
+        name="pytest-helm-prefetch",
+        daemon=True,
+    ).start()
+
+
+async def _render_all(
+    futures: dict[_RenderKey, Future[ManifestIndex]],
+    *,
+    cwd: str,
+    env: dict[str, str],
+) -> None:
+    # Run at most one Helm process per CPU at a time.
+    limit = asyncio.Semaphore(os.cpu_count() or 1)
+    await asyncio.gather(
+        *(
+            _render_one(key, future, limit=limit, cwd=cwd, env=env)
+            for key, future in futures.items()
+        )
+    )
+
+
+async def _render_one(
+    key: _RenderKey,
+    future: Future[ManifestIndex],
+    *,
+    limit: asyncio.Semaphore,
+    cwd: str,
+    env: dict[str, str],
+) -> None:
+    command, on_duplicate = key
+    try:
+        async with limit:
+            rendered = await _run_helm_async(command, cwd=cwd, env=env)
+            # Parse off the loop so other renders keep streaming.
+            index = await asyncio.to_thread(
+                parse_manifest_documents, rendered, on_duplicate=on_duplicate
+            )
+    except Exception as exc:
+        future.set_exception(exc)
+    else:
+        future.set_result(index)
+
+
+def clear_prefetched() -> None:
+    """Forget background renders; ones still running finish unobserved."""
+    _PREFETCHED.clear()
@@ -5,29 +5,24 @@ from __future__ import annotations
 import argparse
 from collections.abc import Sequence
 from pathlib import Path
-from textwrap import dedent
 
 SCAFFOLD_DIRECTORY = "test"
 
-CONFTEST_TEMPLATE = dedent(
-    """\
-    from pytest_helm import manifest_fixture
+CONFTEST_TEMPLATE = """\
+from pytest_helm import manifest_fixture
 
-    # Update this command for your chart path and values files.
-    chart_manifest = manifest_fixture(
-        "chart_manifest",
-        ["helm", "template", "."],
-    )
-    """
+# Update this command for your chart path and values files.
+chart_manifest = manifest_fixture(
+    "chart_manifest",
+    ["helm", "template", "."],
 )
+"""
 
-DEPLOYMENTS_TEMPLATE = dedent(
-    """\
-    def test_deployment_uses_apps_v1(chart_manifest):
-        deployment = chart_manifest.get("apps/v1/deployment/example")
-        assert deployment.apiVersion == "apps/v1"
-    """
-)
+DEPLOYMENTS_TEMPLATE = """\
+def test_deployment_uses_apps_v1(chart_manifest):
+    deployment = chart_manifest.get("apps/v1/deployment/example")
+    assert deployment.apiVersion == "apps/v1"
+"""
 
 
 def scaffold_tests(*, root: Path, force: bool = False) -> list[Path]:
@@ -51,7 +46,7 @@ def scaffold_tests(*, root: Path, force: bool = False) -> list[Path]:
     test_dir.mkdir(parents=True, exist_ok=True)
     created: list[Path] = []
     for path, content in files.items():
-        path.write_text(content, encoding="utf-8")
+        path.write_text(content, encoding="utf-8", newline="\n")
         created.append(path)
 
     return created
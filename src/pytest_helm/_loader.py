@@ -2,16 +2,39 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
 from typing import Any, Literal
-from box import Box
-from ruamel.yaml import YAML
+import asyncio
+import itertools
+import re
 import shlex
 import subprocess
+import sys
+import threading
+import yaml
+from yaml.constructor import SafeConstructor
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover - libyaml bindings are optional
+    from yaml import SafeLoader as _Loader
 
 DuplicatePolicy = Literal["error", "ignore"]
 
+# Helm writes UTF-8 regardless of the locale.
+_HELM_ENCODING = "utf-8"
+
+_STR_TAG = "tag:yaml.org,2002:str"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_HEADER_CONSTRUCTOR = SafeConstructor()
+_SUPPORTED_TAGS = frozenset(
+    tag for tag in SafeConstructor.yaml_constructors if tag is not None
+) | {"tag:yaml.org,2002:merge", "tag:yaml.org,2002:value"}
+_DOCUMENT_START = re.compile(r"---(?:\s|$)")
+_DOCUMENT_END = re.compile(r"\.\.\.(?:\s|$)")
+_BLANK_LINE = re.compile(r"\s*(?:#.*)?$")
+
 
 class HelmTemplateError(RuntimeError):
     """Raised when the Helm command fails to run successfully."""
@@ -54,32 +77,132 @@ class AmbiguousManifestError(LookupError):
     """Raised when a selector without apiVersion matches multiple manifests."""
 
 
-@dataclass(frozen=True)
+class _Manifest(dict):
+    """Manifest mapping that also exposes its keys as attributes.
+
+    Documents are loaded with `_ManifestLoader`, so every nested mapping is
+    already a `_Manifest`, whichever way it is reached.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, key: str) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(f"Manifest has no key {key!r}") from None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a deep copy built from plain dicts and lists."""
+        return _to_plain(self)
+
+    def __repr__(self) -> str:
+        return f"Manifest({dict.__repr__(self)})"
+
+
+def _to_plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+class _ManifestLoader(_Loader):
+    """Safe loader that builds every mapping as a `_Manifest`."""
+
+
+def _construct_manifest(loader: _ManifestLoader, node: yaml.MappingNode) -> Iterator[_Manifest]:
+    manifest = _Manifest()
+    yield manifest
+    manifest.update(loader.construct_mapping(node))
+
+
+_ManifestLoader.add_constructor("tag:yaml.org,2002:map", _construct_manifest)
+
+
+@dataclass(slots=True)
 class _ManifestRecord:
     api_version: str
     kind: str
     name: str
-    manifest: Any
+    source: str
+    document_number: int
+    line_offset: int
+    api_version_cf: str
+    kind_cf: str
+    name_cf: str
+    _manifest: _Manifest | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def duplicate_key(self) -> tuple[str, str, str]:
-        return (
-            self.kind.casefold(),
-            self.name.casefold(),
-            self.api_version.casefold(),
-        )
+        return (self.kind_cf, self.name_cf, self.api_version_cf)
+
+    def get_manifest(self) -> _Manifest:
+        # Loading is deferred until a test actually asks for the manifest;
+        # indexing only composes the document and reads its header scalars.
+        if self._manifest is None:
+            try:
+                manifest = yaml.load(self.source, Loader=_ManifestLoader)
+            except (yaml.YAMLError, ValueError) as exc:
+                # The safe constructor reports bad scalars (e.g. `!!int abc`)
+                # with plain ValueErrors.
+                _shift_marks(exc, self.line_offset)
+                raise ManifestParseError(
+                    f"YAML document #{self.document_number} could not be loaded: {exc}"
+                ) from exc
+            self._manifest = manifest
+        return self._manifest
 
 
 class ManifestIndex:
-    """Selector-based manifest lookup over a parsed Helm render."""
+    """Selector-based manifest lookup over a parsed Helm render.
+
+    Every document is composed and checked for unsupported tags when the
+    index is built, but values are only constructed on the first `get()` of
+    each manifest, so errors such as `!!int abc` surface there as
+    `ManifestParseError`.
+    """
+
+    def __init__(self, records: Iterable[_ManifestRecord] | None = None) -> None:
+        self._by_kind: dict[str, list[_ManifestRecord]] = {}
+        self._by_kind_name: dict[tuple[str, str], list[_ManifestRecord]] = {}
+        self._by_key: dict[tuple[str, str, str], _ManifestRecord] = {}
+
+        for record in records or ():
+            self._by_key.setdefault(record.duplicate_key, record)
+            self._by_kind.setdefault(record.kind_cf, []).append(record)
+            self._by_kind_name.setdefault((record.kind_cf, record.name_cf), []).append(
+                record
+            )
 
-    def __init__(self, records: Sequence[_ManifestRecord] | None = None) -> None:
-        self._records = tuple(records or ())
+        # Error messages and repr() only depend on the records, so build the
+        # listings once instead of on every failed lookup.
+        kinds = [kind_records[0].kind for kind_records in self._by_kind.values()]
+        self._available_kinds_text = ", ".join(sorted(kinds, key=str.casefold))
+        self._available_names_text: dict[str, str] = {
+            kind_cf: ", ".join(self._available_names_for_kind(kind_records))
+            for kind_cf, kind_records in self._by_kind.items()
+        }
+        self._repr_cache: str | None = None
+
+        # Most charts render one manifest per kind/name; when that holds, a
+        # plain dictionary lookup answers every successful get().
+        if all(len(name_records) == 1 for name_records in self._by_kind_name.values()):
+            self._unique: dict[tuple[str, str], _ManifestRecord] = {
+                key: name_records[0] for key, name_records in self._by_kind_name.items()
+            }
+            self.get = self._get_unique
 
     def get(self, selector: str) -> Any:
         api_version, kind, name = self._parse_selector(selector)
-        kind_records = self._records_for_kind(kind)
-        name_records = self._records_for_name(kind_records, kind=kind, name=name)
+        kind_cf = kind.casefold()
+        name_cf = name.casefold()
+
+        self._records_for_kind(kind, kind_cf=kind_cf)
+        name_records = self._records_for_name(
+            kind=kind, name=name, kind_cf=kind_cf, name_cf=name_cf
+        )
 
         if api_version is None:
             return self._single_or_ambiguous(kind=kind, name=name, records=name_records)
@@ -88,34 +211,43 @@ class ManifestIndex:
             kind=kind,
             name=name,
             api_version=api_version,
+            key=(kind_cf, name_cf, api_version.casefold()),
             records=name_records,
         )
 
-    def _records_for_kind(self, kind: str) -> list[_ManifestRecord]:
-        kind_cf = kind.casefold()
-        matches = [record for record in self._records if record.kind.casefold() == kind_cf]
+    def _get_unique(self, selector: str) -> Any:
+        api_version, kind, name = self._parse_selector(selector)
+        record = self._unique.get((kind.casefold(), name.casefold()))
+        if record is None or (
+            api_version is not None and record.api_version_cf != api_version.casefold()
+        ):
+            # Misses take the general path so they raise the usual errors.
+            return ManifestIndex.get(self, selector)
+        return record.get_manifest()
+
+    def _records_for_kind(self, kind: str, *, kind_cf: str) -> list[_ManifestRecord]:
+        matches = self._by_kind.get(kind_cf)
         if matches:
             return matches
 
-        available = ", ".join(self._available_kinds())
         raise KeyError(
             f"Kind {kind!r} not found. "
-            f"Available kinds: {available or '(none)'}"
+            f"Available kinds: {self._available_kinds_text or '(none)'}"
         )
 
     def _records_for_name(
         self,
-        records: Sequence[_ManifestRecord],
         *,
         kind: str,
         name: str,
+        kind_cf: str,
+        name_cf: str,
     ) -> list[_ManifestRecord]:
-        name_cf = name.casefold()
-        matches = [record for record in records if record.name.casefold() == name_cf]
+        matches = self._by_kind_name.get((kind_cf, name_cf))
         if matches:
             return matches
 
-        available = ", ".join(self._available_names_for_kind(records))
+        available = self._available_names_text.get(kind_cf, "")
         raise KeyError(
             f"Manifest {kind!r}/{name!r} not found. "
             f"Available names for {kind!r}: {available or '(none)'}"
@@ -128,73 +260,73 @@ class ManifestIndex:
         name: str,
         records: Sequence[_ManifestRecord],
     ) -> Any:
-        api_versions = sorted({record.api_version for record in records}, key=str.casefold)
+        if len(records) == 1:
+            return records[0].get_manifest()
 
+        api_versions = sorted(
+            dict.fromkeys(record.api_version for record in records), key=str.casefold
+        )
         if len(api_versions) > 1:
             raise AmbiguousManifestError(
                 f"Manifest {kind!r}/{name!r} is ambiguous across apiVersions: "
                 f"{', '.join(api_versions)}. Use 'apiVersion/kind/name'."
             )
 
-        return records[0].manifest
+        return records[0].get_manifest()
 
-    @staticmethod
     def _match_api_version(
+        self,
         *,
         kind: str,
         name: str,
         api_version: str,
+        key: tuple[str, str, str],
         records: Sequence[_ManifestRecord],
     ) -> Any:
-        api_cf = api_version.casefold()
-        for record in records:
-            if record.api_version.casefold() == api_cf:
-                return record.manifest
+        record = self._by_key.get(key)
+        if record is not None:
+            return record.get_manifest()
 
-        available = ", ".join(
-            sorted({record.api_version for record in records}, key=str.casefold)
-        )
+        api_versions = dict.fromkeys(record.api_version for record in records)
+        available = ", ".join(sorted(api_versions, key=str.casefold))
         raise KeyError(
             f"Manifest {kind!r}/{name!r} with apiVersion {api_version!r} not found. "
             f"Available apiVersions for {kind!r}/{name!r}: {available or '(none)'}"
         )
 
-    def _available_kinds(self) -> list[str]:
-        seen: dict[str, str] = {}
-        for record in self._records:
-            seen.setdefault(record.kind.casefold(), record.kind)
-        return sorted(seen.values(), key=str.casefold)
-
     @staticmethod
     def _available_names_for_kind(records: Sequence[_ManifestRecord]) -> list[str]:
         seen: dict[str, str] = {}
         for record in records:
-            seen.setdefault(record.name.casefold(), record.name)
+            seen.setdefault(record.name_cf, record.name)
         return sorted(seen.values(), key=str.casefold)
 
     @staticmethod
     def _parse_selector(selector: str) -> tuple[str | None, str, str]:
-        parts = [part for part in selector.strip("/").split("/") if part]
-        if len(parts) < 2:
+        rest, _, name = selector.strip("/").rpartition("/")
+        api_version, _, kind = rest.rpartition("/")
+        if not kind or not name:
             raise ValueError(
                 f"Invalid selector {selector!r}. Expected 'kind/name' or "
                 "'apiVersion/kind/name'."
             )
 
-        name = parts[-1]
-        kind = parts[-2]
-        api_version = "/".join(parts[:-2]) or None
-        return api_version, kind, name
+        return api_version or None, kind, name
 
     def __repr__(self) -> str:
+        if self._repr_cache is None:
+            self._repr_cache = self._build_repr()
+        return self._repr_cache
+
+    def _build_repr(self) -> str:
         by_kind: dict[str, dict[str, tuple[str, set[str]]]] = {}
         kind_case: dict[str, str] = {}
 
-        for record in self._records:
-            kind_key = record.kind.casefold()
+        for record in itertools.chain.from_iterable(self._by_kind_name.values()):
+            kind_key = record.kind_cf
             kind_case.setdefault(kind_key, record.kind)
             by_kind.setdefault(kind_key, {})
-            name_key = record.name.casefold()
+            name_key = record.name_cf
             display_name, api_versions = by_kind[kind_key].setdefault(
                 name_key, (record.name, set())
             )
@@ -202,7 +334,7 @@ class ManifestIndex:
             by_kind[kind_key][name_key] = (display_name, api_versions)
 
         kind_entries = []
-        for kind_key in sorted(by_kind, key=str.casefold):
+        for kind_key in sorted(by_kind):
             kind = kind_case[kind_key]
             names = sorted(by_kind[kind_key].values(), key=lambda item: item[0].casefold())
             formatted_names: list[str] = []
@@ -221,31 +353,18 @@ class ManifestIndex:
         return f"ManifestIndex({{{', '.join(kind_entries)}}})"
 
 
-
-def _apply_duplicate_policy(
-    records: Sequence[_ManifestRecord],
-    *,
-    on_duplicate: DuplicatePolicy,
-) -> list[_ManifestRecord]:
-    deduped: list[_ManifestRecord] = []
-    seen: set[tuple[str, str, str]] = set()
-
-    for record in records:
-        key = record.duplicate_key
-        if key in seen:
-            if on_duplicate == "error":
-                raise DuplicateManifestError(
-                    "Duplicate manifest detected for "
-                    f"apiVersion={record.api_version!r}, "
-                    f"kind={record.kind!r}, name={record.name!r}. "
-                    "Set on_duplicate='ignore' to keep the first document."
-                )
-            continue
-
-        seen.add(key)
-        deduped.append(record)
-
-    return deduped
+def open_helm_template(command: Sequence[str]) -> subprocess.Popen[str]:
+    """Start `helm template ...` with stdout and stderr piped back as text."""
+    try:
+        return subprocess.Popen(
+            list(command),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding=_HELM_ENCODING,
+            bufsize=1,
+        )
+    except OSError as exc:
+        raise HelmTemplateError(command, cause=exc) from exc
 
 
 def run_helm_template(command: Sequence[str]) -> str:
@@ -254,7 +373,7 @@ def run_helm_template(command: Sequence[str]) -> str:
         completed = subprocess.run(
             list(command),
             capture_output=True,
-            text=True,
+            encoding=_HELM_ENCODING,
             check=False,
         )
     except OSError as exc:
@@ -270,53 +389,320 @@ def run_helm_template(command: Sequence[str]) -> str:
     return completed.stdout
 
 
+async def _run_helm_async(
+    command: Sequence[str],
+    *,
+    cwd: str | None = None,
+    env: Mapping[str, str] | None = None,
+) -> str:
+    # Used by background prefetching only; the output is decoded exactly like
+    # the text-mode pipes of `run_helm_template` and `open_helm_template`.
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+        )
+    except OSError as exc:
+        raise HelmTemplateError(command, cause=exc) from exc
+
+    stdout, stderr = await process.communicate()
+    if process.returncode != 0:
+        raise HelmTemplateError(
+            command,
+            returncode=process.returncode,
+            stderr=_decode_helm_output(stderr),
+            stdout=_decode_helm_output(stdout),
+        )
+    return _decode_helm_output(stdout)
+
+
+def _decode_helm_output(data: bytes) -> str:
+    # Match text-mode pipes: strict decoding plus universal newlines.
+    text = data.decode(_HELM_ENCODING)
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _stream_helm_template(
+    command: Sequence[str],
+    *,
+    on_duplicate: DuplicatePolicy,
+) -> ManifestIndex:
+    process = open_helm_template(command)
+
+    # Drain stderr concurrently so a chatty Helm cannot block on a full pipe
+    # while stdout is being parsed.
+    stderr_chunks: list[str] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(process.stderr.read()),
+        daemon=True,
+    )
+    stderr_reader.start()
+
+    # Keep what Helm wrote so a failed render still reports its output.
+    stdout_chunks: list[str] = []
+    parse_error: Exception | None = None
+    try:
+        try:
+            index = _index_documents(
+                _split_documents(_recording(process.stdout, stdout_chunks)),
+                on_duplicate=on_duplicate,
+            )
+        except Exception as exc:
+            # Let Helm finish so a failed render is reported as such instead
+            # of as a parse error on its partial output.
+            parse_error = exc
+            stdout_chunks.append(process.stdout.read())
+        returncode = process.wait()
+    finally:
+        process.stdout.close()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        stderr_reader.join()
+        process.stderr.close()
+
+    if returncode != 0:
+        raise HelmTemplateError(
+            command,
+            returncode=returncode,
+            stderr="".join(stderr_chunks),
+            stdout="".join(stdout_chunks),
+        ) from parse_error
+    if parse_error is not None:
+        raise parse_error
+    return index
+
+
+def _recording(lines: Iterable[str], chunks: list[str]) -> Iterator[str]:
+    for line in lines:
+        chunks.append(line)
+        yield line
+
+
 def parse_manifest_documents(
     manifest_text: str,
     *,
     on_duplicate: DuplicatePolicy = "error",
 ) -> ManifestIndex:
     """Parse Helm manifest YAML output into a selector-based index."""
+    documents = _split_documents(manifest_text.splitlines(keepends=True))
+    return _index_documents(documents, on_duplicate=on_duplicate)
+
+
+def _split_documents(lines: Iterable[str]) -> Iterator[tuple[int, int, str]]:
+    """Yield `(document_number, line_offset, source)` per non-blank document.
+
+    `line_offset` is the zero-based line in the whole render on which
+    `source` starts, so error positions can be reported against the render.
+
+    Helm separates every template with `---` and a `# Source:` comment, so a
+    large share of documents are empty. Splitting on `---` and `...` lines
+    lets those be skipped without invoking the YAML loader at all.
+    """
+    document_number = 0
+    line_offset = 0
+    buffer: list[str] = []
+    # `explicit`: the buffer holds a `---` marker. `has_content`: it holds
+    # something besides markers, directives, blank lines and comments.
+    explicit = has_content = False
+
+    for line_number, line in enumerate(itertools.chain(lines, (None,))):
+        if line is not None and _DOCUMENT_START.match(line):
+            if explicit or has_content:
+                document_number += 1
+                if has_content:
+                    yield document_number, line_offset, "".join(buffer)
+                buffer = []
+                line_offset = line_number
+            # Otherwise the buffer only holds directives (e.g. `%YAML 1.1`)
+            # and comments, which belong to the document this marker opens.
+            buffer.append(line)
+            explicit = True
+            # Anything after the marker (e.g. `--- |`) is document content.
+            has_content = not _BLANK_LINE.match(line, 3)
+            continue
 
-    yaml = YAML(typ="safe")
-    records: list[_ManifestRecord] = []
-
-    for document_number, document in enumerate(yaml.load_all(manifest_text), start=1):
-        if document is None:
+        if line is None or _DOCUMENT_END.match(line):
+            if line is not None:
+                buffer.append(line)
+            if explicit or has_content:
+                document_number += 1
+                if has_content:
+                    yield document_number, line_offset, "".join(buffer)
+            buffer = []
+            line_offset = line_number + 1
+            explicit = has_content = False
             continue
-        if not isinstance(document, Mapping):
-            raise ManifestParseError(
-                f"YAML document #{document_number} is not a mapping object."
-            )
 
-        kind = document.get("kind")
-        api_version = document.get("apiVersion")
-        metadata = document.get("metadata")
-        name = metadata.get("name") if isinstance(metadata, Mapping) else None
+        buffer.append(line)
+        if not has_content and not _BLANK_LINE.match(line):
+            # Directives are only valid before a document's `---` marker.
+            has_content = explicit or not line.startswith("%")
+
+
+def _mapping_value(node: yaml.MappingNode, key: str) -> yaml.Node | None:
+    # Expand `<<` merge keys in place, as the constructor would.
+    _HEADER_CONSTRUCTOR.flatten_mapping(node)
+    value = None
+    for key_node, value_node in node.value:
+        if _string_scalar(key_node) == key:
+            value = value_node
+    return value
+
+
+def _string_scalar(node: yaml.Node | None) -> str | None:
+    if isinstance(node, yaml.ScalarNode) and node.tag == _STR_TAG:
+        return node.value
+    return None
+
 
-        if not isinstance(api_version, str) or not api_version:
+def _index_documents(
+    documents: Iterable[tuple[int, int, str]],
+    *,
+    on_duplicate: DuplicatePolicy,
+) -> ManifestIndex:
+    return ManifestIndex(_iter_records(documents, on_duplicate=on_duplicate))
+
+
+def _check_tags(root: yaml.Node, document_number: int, line_offset: int) -> None:
+    # Reject tags the safe constructor cannot build now, so a broken render
+    # fails at parse time rather than on the first lookup of that manifest.
+    seen: set[int] = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.tag not in _SUPPORTED_TAGS:
             raise ManifestParseError(
-                f"YAML document #{document_number} is missing non-empty 'apiVersion'."
+                f"YAML document #{document_number} uses unsupported tag {node.tag!r} "
+                f"at line {line_offset + node.start_mark.line + 1}."
             )
-        if not isinstance(kind, str) or not kind:
-            raise ManifestParseError(
-                f"YAML document #{document_number} is missing non-empty 'kind'."
+        if isinstance(node, yaml.ScalarNode) or id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            for key_node, value_node in node.value:
+                stack.append(key_node)
+                stack.append(value_node)
+        else:
+            stack.extend(node.value)
+
+
+def _shift_marks(exc: BaseException, line_offset: int) -> None:
+    # Marks count lines from the start of the document's own source; replace
+    # them (libyaml marks are read-only) so the message points at the line in
+    # the whole render.
+    shifted: dict[int, yaml.Mark] = {}
+    for attr in ("context_mark", "problem_mark"):
+        mark = getattr(exc, attr, None)
+        if mark is None:
+            continue
+        if id(mark) not in shifted:
+            shifted[id(mark)] = yaml.Mark(
+                mark.name,
+                mark.index,
+                mark.line + line_offset,
+                mark.column,
+                mark.buffer,
+                mark.pointer,
             )
-        if not isinstance(name, str) or not name:
+        setattr(exc, attr, shifted[id(mark)])
+
+
+def _read_header(
+    source: str,
+    *,
+    document_number: int,
+    line_offset: int,
+) -> tuple[str, str, str] | None:
+    """Return `(apiVersion, kind, metadata.name)` for one document source."""
+    try:
+        node = yaml.compose(source, Loader=_Loader)
+        if node is None or node.tag == _NULL_TAG:
+            return None
+        if not isinstance(node, yaml.MappingNode):
             raise ManifestParseError(
-                f"YAML document #{document_number} is missing non-empty 'metadata.name'."
+                f"YAML document #{document_number} is not a mapping object."
             )
+        _check_tags(node, document_number, line_offset)
+
+        # Merge keys are expanded here, so a bad one (e.g. `<<: 5`) raises
+        # a ConstructorError that needs the same wrapping as parser errors.
+        kind = _string_scalar(_mapping_value(node, "kind"))
+        api_version = _string_scalar(_mapping_value(node, "apiVersion"))
+        metadata = _mapping_value(node, "metadata")
+        name = (
+            _string_scalar(_mapping_value(metadata, "name"))
+            if isinstance(metadata, yaml.MappingNode)
+            else None
+        )
+    except yaml.YAMLError as exc:
+        _shift_marks(exc, line_offset)
+        raise ManifestParseError(
+            f"YAML document #{document_number} is not valid YAML: {exc}"
+        ) from exc
+
+    if not api_version:
+        raise ManifestParseError(
+            f"YAML document #{document_number} is missing non-empty 'apiVersion'."
+        )
+    if not kind:
+        raise ManifestParseError(
+            f"YAML document #{document_number} is missing non-empty 'kind'."
+        )
+    if not name:
+        raise ManifestParseError(
+            f"YAML document #{document_number} is missing non-empty 'metadata.name'."
+        )
+    return api_version, kind, name
 
-        records.append(
-            _ManifestRecord(
-                api_version=api_version,
-                kind=kind,
-                name=name,
-                manifest=Box(document),
-            )
+
+def _iter_records(
+    documents: Iterable[tuple[int, int, str]],
+    *,
+    on_duplicate: DuplicatePolicy,
+) -> Iterator[_ManifestRecord]:
+    # Validation, duplicate handling and indexing (in ManifestIndex.__init__)
+    # all happen in a single pass over the documents.
+    seen: set[tuple[str, str, str]] = set()
+
+    for document_number, line_offset, source in documents:
+        header = _read_header(
+            source, document_number=document_number, line_offset=line_offset
         )
+        if header is None:
+            continue
 
-    deduped_records = _apply_duplicate_policy(records, on_duplicate=on_duplicate)
-    return ManifestIndex(deduped_records)
+        api_version, kind, name = header
+        # apiVersion and kind values repeat across most of a render; interning
+        # shares one string per value and lets index lookups compare by identity.
+        record = _ManifestRecord(
+            api_version=sys.intern(api_version),
+            kind=sys.intern(kind),
+            name=name,
+            source=source,
+            document_number=document_number,
+            line_offset=line_offset,
+            api_version_cf=sys.intern(api_version.casefold()),
+            kind_cf=sys.intern(kind.casefold()),
+            name_cf=name.casefold(),
+        )
+
+        key = record.duplicate_key
+        if key in seen:
+            if on_duplicate == "error":
+                raise DuplicateManifestError(
+                    "Duplicate manifest detected for "
+                    f"apiVersion={record.api_version!r}, "
+                    f"kind={record.kind!r}, name={record.name!r}. "
+                    "Set on_duplicate='ignore' to keep the first document."
+                )
+            continue
+
+        seen.add(key)
+        yield record
 
 
 def load_manifest(
@@ -324,6 +710,10 @@ def load_manifest(
     *,
     on_duplicate: DuplicatePolicy = "error",
 ) -> ManifestIndex:
-    """Run Helm and parse output into a manifest index."""
-    rendered = run_helm_template(command)
-    return parse_manifest_documents(rendered, on_duplicate=on_duplicate)
+    """Run Helm and parse its output into a manifest index.
+
+    Helm's stdout is streamed straight into the YAML loader, so parsing
+    overlaps with rendering. Helm is invoked on every call; fixtures created
+    with `manifest_fixture` share one render per command for the session.
+    """
+    return _stream_helm_template(command, on_duplicate=on_duplicate)
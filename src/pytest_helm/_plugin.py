@@ -0,0 +1,42 @@
+"""Pytest plugin hooks registered through the `pytest11` entry point."""
+
+from __future__ import annotations
+
+import pytest
+
+from ._api import clear_prefetched, prefetch_manifests
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("helm")
+    group.addoption(
+        "--no-helm-prefetch",
+        action="store_true",
+        default=False,
+        help="Render manifest fixtures lazily instead of in the background "
+        "once collection finishes.",
+    )
+
+
+def pytest_collection_finish(session: pytest.Session) -> None:
+    config = session.config
+    if config.option.collectonly or config.option.no_helm_prefetch:
+        return
+    # pytest-xdist workers collect every test but only run the ones the
+    # controller hands them, so renders there stay lazy.
+    if hasattr(config, "workerinput"):
+        return
+
+    # Fixtures defined in nested conftests and test modules only exist once
+    # collection is done, so this is the earliest point all renders are known.
+    # session.items already excludes deselected tests.
+    fixture_names = {
+        name
+        for item in session.items
+        for name in getattr(item, "fixturenames", ())
+    }
+    prefetch_manifests(fixture_names)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    clear_prefetched()
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import sys
+import threading
+
 import pytest
 
 import pytest_helm._api as api
-from pytest_helm import ManifestIndex, manifest_fixture
+from pytest_helm import HelmTemplateError, ManifestIndex, manifest_fixture
 
 
 def test_manifest_fixture_validates_inputs() -> None:
@@ -13,6 +17,9 @@ def test_manifest_fixture_validates_inputs() -> None:
     with pytest.raises(ValueError, match="non-empty sequence"):
         manifest_fixture("default_manifest", [])
 
+    with pytest.raises(ValueError, match="non-empty sequence"):
+        manifest_fixture("default_manifest", None)
+
     with pytest.raises(ValueError, match="non-empty strings"):
         manifest_fixture("default_manifest", ["helm", "", "."])
 
@@ -25,6 +32,8 @@ def test_manifest_fixture_creates_named_session_fixture(monkeypatch) -> None:
         return expected
 
     monkeypatch.setattr(api, "load_manifest", fake_load_manifest)
+    monkeypatch.setattr(api, "_REGISTRY", {})
+    monkeypatch.setattr(api, "_PREFETCHED", {})
 
     fixture_function = manifest_fixture(
         "default_manifest",
@@ -42,3 +51,147 @@ def test_manifest_fixture_creates_named_session_fixture(monkeypatch) -> None:
     assert calls == [
         (("helm", "template", ".", "-f", "values.yaml"), "ignore")
     ]
+
+    # Another fixture with the same command shares the session's render.
+    same_command = manifest_fixture(
+        "same_manifest",
+        ["helm", "template", ".", "-f", "values.yaml"],
+        on_duplicate="ignore",
+    )
+    assert same_command.__wrapped__() is expected
+    assert len(calls) == 1
+
+
+def test_prefetch_manifests_renders_each_command_once(monkeypatch) -> None:
+    calls: list[tuple[str, ...]] = []
+
+    async def fake_run_helm_async(command, *, cwd, env):
+        calls.append(tuple(command))
+        return "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: prefetched\n"
+
+    def fail_load_manifest(command, *, on_duplicate):
+        raise AssertionError("prefetched fixtures should not render again")
+
+    monkeypatch.setattr(api, "_run_helm_async", fake_run_helm_async)
+    monkeypatch.setattr(api, "load_manifest", fail_load_manifest)
+    monkeypatch.setattr(api, "_REGISTRY", {})
+    monkeypatch.setattr(api, "_PREFETCHED", {})
+
+    first = manifest_fixture("first_manifest", ["helm", "template", "."])
+    second = manifest_fixture("second_manifest", ["helm", "template", "."])
+    manifest_fixture("unused_manifest", ["helm", "template", "other"])
+
+    api.prefetch_manifests(["first_manifest", "second_manifest", "tmp_path"])
+
+    manifests = first.__wrapped__()
+    assert second.__wrapped__() is manifests
+    assert manifests.get("configmap/prefetched").metadata.name == "prefetched"
+    assert calls == [("helm", "template", ".")]
+
+
+def test_prefetch_manifests_renders_every_override_of_a_fixture_name(monkeypatch) -> None:
+    calls: list[tuple[str, ...]] = []
+
+    async def fake_run_helm_async(command, *, cwd, env):
+        calls.append(tuple(command))
+        return f"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: {command[-1]}\n"
+
+    def fail_load_manifest(command, *, on_duplicate):
+        raise AssertionError("prefetched fixtures should not render again")
+
+    monkeypatch.setattr(api, "_run_helm_async", fake_run_helm_async)
+    monkeypatch.setattr(api, "load_manifest", fail_load_manifest)
+    monkeypatch.setattr(api, "_REGISTRY", {})
+    monkeypatch.setattr(api, "_PREFETCHED", {})
+
+    # The same fixture name defined by conftests in two directories.
+    staging = manifest_fixture("chart", ["helm", "template", "staging"])
+    production = manifest_fixture("chart", ["helm", "template", "production"])
+
+    api.prefetch_manifests(["chart"])
+
+    assert staging.__wrapped__().get("configmap/staging")
+    assert production.__wrapped__().get("configmap/production")
+    assert sorted(calls) == [
+        ("helm", "template", "production"),
+        ("helm", "template", "staging"),
+    ]
+
+
+def test_prefetch_manifests_reraises_render_errors_from_fixture(monkeypatch) -> None:
+    monkeypatch.setattr(api, "_REGISTRY", {})
+    monkeypatch.setattr(api, "_PREFETCHED", {})
+
+    failing = manifest_fixture(
+        "failing_manifest",
+        [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"],
+    )
+
+    api.prefetch_manifests(["failing_manifest"])
+
+    with pytest.raises(HelmTemplateError, match="exit code 3"):
+        failing.__wrapped__()
+
+
+def test_prefetch_manifests_pins_cwd_and_env_at_prefetch_time(
+    monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(api, "_REGISTRY", {})
+    monkeypatch.setattr(api, "_PREFETCHED", {})
+    monkeypatch.setenv("PYTEST_HELM_TEST_NAME", "pinned")
+    chart_dir = tmp_path / "chart"
+    chart_dir.mkdir()
+    (chart_dir / "name.txt").write_text("from-chart-dir")
+    monkeypatch.chdir(chart_dir)
+
+    script = (
+        "import os; "
+        "print('apiVersion: v1\\nkind: ConfigMap\\nmetadata:\\n  name: '"
+        " + os.environ['PYTEST_HELM_TEST_NAME'] + '-' + open('name.txt').read())"
+    )
+    fixture = manifest_fixture("pinned_manifest", [sys.executable, "-c", script])
+
+    started = threading.Event()
+    real_run_helm_async = api._run_helm_async
+
+    async def delayed_run_helm_async(command, *, cwd, env):
+        await asyncio.to_thread(started.wait)
+        return await real_run_helm_async(command, cwd=cwd, env=env)
+
+    monkeypatch.setattr(api, "_run_helm_async", delayed_run_helm_async)
+    api.prefetch_manifests(["pinned_manifest"])
+
+    # A test changing directory and environment before the render starts.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYTEST_HELM_TEST_NAME", "changed")
+    started.set()
+
+    assert fixture.__wrapped__().get("configmap/pinned-from-chart-dir")
+
+
+def test_prefetch_manifests_runs_at_most_cpu_count_renders_at_once(monkeypatch) -> None:
+    monkeypatch.setattr(api, "_REGISTRY", {})
+    monkeypatch.setattr(api, "_PREFETCHED", {})
+    monkeypatch.setattr(api.os, "cpu_count", lambda: 2)
+    running = 0
+    peak = 0
+
+    async def fake_run_helm_async(command, *, cwd, env):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: {command[-1]}\n"
+
+    monkeypatch.setattr(api, "_run_helm_async", fake_run_helm_async)
+    fixtures = [
+        manifest_fixture(f"manifest_{index}", ["helm", "template", f"chart-{index}"])
+        for index in range(6)
+    ]
+
+    api.prefetch_manifests([f"manifest_{index}" for index in range(6)])
+
+    for index, fixture in enumerate(fixtures):
+        assert fixture.__wrapped__().get(f"configmap/chart-{index}")
+    assert peak == 2
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import subprocess
+import sys
 
 import pytest
 
-pytest.importorskip("box")
-pytest.importorskip("ruamel.yaml")
+pytest.importorskip("yaml")
 
 from pytest_helm import (
     AmbiguousManifestError,
@@ -15,6 +16,8 @@ from pytest_helm import (
     load_manifest,
     parse_manifest_documents,
 )
+import pytest_helm._loader as loader
+from pytest_helm._loader import run_helm_template
 
 
 def test_parse_manifest_documents_indexes_by_selector() -> None:
@@ -60,6 +63,57 @@ spec:
     assert deployment_upper is deployment
 
 
+def test_manifest_supports_attribute_and_item_access() -> None:
+    manifests = parse_manifest_documents(
+        """
+apiVersion: v1
+kind: Service
+metadata:
+  name: api
+spec:
+  selector:
+    app.kubernetes.io/name: api
+  ports:
+    - port: 80
+    - port: 443
+""".strip()
+    )
+
+    service = manifests.get("service/api")
+
+    assert service.spec.selector["app.kubernetes.io/name"] == "api"
+    assert [port.port for port in service.spec.ports] == [80, 443]
+    assert service.spec.ports[-1] is service["spec"]["ports"][1]
+    assert service.get("status") is None
+    assert isinstance(service, dict)
+    with pytest.raises(AttributeError, match="no key 'status'"):
+        service.status
+
+
+def test_manifest_wraps_nested_values_reached_without_attribute_access() -> None:
+    manifests = parse_manifest_documents(
+        """
+apiVersion: v1
+kind: Service
+metadata:
+  name: api
+spec:
+  ports:
+    - port: 80
+""".strip()
+    )
+
+    service = manifests.get("service/api")
+    spec = dict(service.items())["spec"]
+
+    assert [port.port for port in spec.ports] == [80]
+    assert next(iter(service.values())) == "v1"
+    assert service.pop("metadata").name == "api"
+    assert service.setdefault("spec").ports[0].port == 80
+    assert service.to_dict() == {"apiVersion": "v1", "kind": "Service", "spec": {"ports": [{"port": 80}]}}
+    assert type(service.to_dict()["spec"]) is dict
+
+
 def test_manifest_index_repr_includes_kind_and_name_keys() -> None:
     manifest_text = """
 apiVersion: v1
@@ -117,6 +171,8 @@ spec: {}
 
     with pytest.raises(ValueError, match="Expected 'kind/name' or 'apiVersion/kind/name'"):
         manifests.get("Deployment")
+    with pytest.raises(ValueError, match="Invalid selector"):
+        manifests.get("deployment//release-name")
 
 
 def test_manifest_index_get_raises_for_missing_values() -> None:
@@ -256,16 +312,267 @@ metadata: {}
         )
 
 
-def test_load_manifest_raises_helm_template_error_on_nonzero_exit(monkeypatch) -> None:
-    def fake_run(*args, **kwargs):
-        return subprocess.CompletedProcess(
-            args=["helm", "template", "."],
-            returncode=1,
-            stdout="",
-            stderr="template failed",
+def test_parse_manifest_documents_reads_headers_through_aliases_and_merge_keys() -> None:
+    manifest_text = """
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  <<: {name: merged}
+data:
+  A: &value shared
+  B: *value
+""".strip()
+
+    manifests = parse_manifest_documents(manifest_text)
+
+    cfg_map = manifests.get("configmap/merged")
+    assert cfg_map.metadata.name == "merged"
+    assert cfg_map.data.B == "shared"
+
+
+def test_parse_manifest_documents_skips_empty_and_comment_only_documents() -> None:
+    manifest_text = """
+---
+# Source: chart/templates/empty.yaml
+---
+# Source: chart/templates/configmap.yaml
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: example-config
+---
+--- {apiVersion: v1, kind: Service, metadata: {name: inline}}
+---
+kind: Secret
+""".strip()
+
+    with pytest.raises(ManifestParseError, match="document #5 is missing non-empty 'apiVersion'"):
+        parse_manifest_documents(manifest_text)
+
+    manifests = parse_manifest_documents(manifest_text.rpartition("---")[0])
+    assert manifests.get("configmap/example-config").kind == "ConfigMap"
+    assert manifests.get("service/inline").metadata.name == "inline"
+
+
+def test_parse_manifest_documents_numbers_documents_across_the_render() -> None:
+    manifest_text = "\n---\n".join(
+        f"apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: config-{index}"
+        for index in range(5)
+    )
+
+    manifests = parse_manifest_documents(manifest_text)
+
+    assert manifests.get("configmap/config-4").metadata.name == "config-4"
+    with pytest.raises(ManifestParseError, match="document #6 is missing non-empty 'kind'"):
+        parse_manifest_documents(manifest_text + "\n---\napiVersion: v1")
+
+
+def test_parse_manifest_documents_rejects_unsupported_tags() -> None:
+    with pytest.raises(
+        ManifestParseError, match="#2 uses unsupported tag '!Custom' at line 10"
+    ):
+        parse_manifest_documents(
+            """
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: fine
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: custom
+data: {x: !Custom foo}
+""".strip()
+        )
+
+
+def test_manifest_value_errors_surface_as_parse_errors_on_get() -> None:
+    manifests = parse_manifest_documents(
+        """
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: bad-int
+data:
+  replicas: !!int abc
+""".strip()
+    )
+
+    with pytest.raises(ManifestParseError, match="document #1 could not be loaded"):
+        manifests.get("configmap/bad-int")
+
+
+def test_parse_manifest_documents_accepts_document_end_markers() -> None:
+    manifests = parse_manifest_documents(
+        """
+---
+...
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: first
+...
+# Source: chart/templates/second.yaml
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: second
+...
+""".strip()
+    )
+
+    assert manifests.get("configmap/first").metadata.name == "first"
+    assert manifests.get("configmap/second").metadata.name == "second"
+
+
+def test_parse_manifest_documents_keeps_directives_with_their_document() -> None:
+    manifest_text = """
+%YAML 1.1
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: first
+...
+%YAML 1.1
+%TAG !k8s! tag:yaml.org,2002:
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: !k8s!str second
+""".strip()
+
+    manifests = parse_manifest_documents(manifest_text)
+
+    assert manifests.get("configmap/first").metadata.name == "first"
+    assert manifests.get("configmap/second").metadata.name == "second"
+    with pytest.raises(ManifestParseError, match="document #2 is not valid YAML") as exc:
+        parse_manifest_documents(manifest_text + "\ndata: [")
+    assert "line 16" in str(exc.value)
+
+
+def test_yaml_errors_report_document_number_and_render_line() -> None:
+    header = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: {}\n"
+    valid = header.format("first")
+
+    with pytest.raises(ManifestParseError, match="document #2 is not valid YAML") as exc:
+        parse_manifest_documents(valid + "---\n" + header.format("second") + "data: [\n")
+    assert isinstance(exc.value.__cause__, loader.yaml.YAMLError)
+    assert "line 11" in str(exc.value)
+
+    with pytest.raises(ManifestParseError, match="document #2 is not valid YAML") as exc:
+        parse_manifest_documents(valid + "---\n" + header.format("merge") + "<<: 5\n")
+    assert isinstance(exc.value.__cause__, loader.yaml.YAMLError)
+    assert "line 10" in str(exc.value)
+
+    manifests = parse_manifest_documents(
+        valid + "---\n" + header.format("binary") + "binaryData:\n  x: !!binary abc\n"
+    )
+    with pytest.raises(ManifestParseError, match="document #2 could not be loaded") as exc:
+        manifests.get("configmap/binary")
+    assert "line 11" in str(exc.value)
+
+
+def test_parse_manifest_documents_rejects_non_string_headers() -> None:
+    with pytest.raises(ManifestParseError, match="missing non-empty 'kind'"):
+        parse_manifest_documents(
+            """
+apiVersion: v1
+kind: 1
+metadata:
+  name: numeric-kind
+""".strip()
         )
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    with pytest.raises(ManifestParseError, match="is not a mapping object"):
+        parse_manifest_documents("- apiVersion: v1")
+
+
+def test_load_manifest_raises_helm_template_error_on_nonzero_exit() -> None:
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; sys.stderr.write('template failed'); sys.exit(1)",
+    ]
+
+    with pytest.raises(HelmTemplateError, match="Helm command failed with exit code 1") as exc:
+        load_manifest(command)
+
+    assert exc.value.stderr == "template failed"
+
+
+def test_load_manifest_prefers_helm_error_over_partial_output_parse_error() -> None:
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; print('kind: [unterminated\\n---\\nrest: 1'); sys.exit(2)",
+    ]
+
+    with pytest.raises(HelmTemplateError, match="exit code 2") as exc:
+        load_manifest(command)
+    assert exc.value.stdout == "kind: [unterminated\n---\nrest: 1\n"
+
+    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: partial\n"
+    command = [sys.executable, "-c", f"import sys; print({rendered!r}); sys.exit(1)"]
+    with pytest.raises(HelmTemplateError, match="exit code 1") as exc:
+        load_manifest(command)
+    assert exc.value.stdout == rendered + "\n"
+
+
+def test_run_helm_template_returns_stdout_and_raises_on_failure() -> None:
+    assert run_helm_template([sys.executable, "-c", "print('rendered')"]) == "rendered\n"
+
+    with pytest.raises(HelmTemplateError, match="exit code 4") as exc:
+        run_helm_template([sys.executable, "-c", "import sys; sys.exit(4)"])
+    assert exc.value.returncode == 4
+
+
+def test_helm_output_is_decoded_the_same_way_on_every_path() -> None:
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; sys.stdout.buffer.write('caf\u00e9\\r\\nx\\n'.encode())",
+    ]
+
+    async def run_inside_loop() -> tuple[str, str]:
+        return run_helm_template(command), await loader._run_helm_async(command)
+
+    sync_text, async_text = asyncio.run(run_inside_loop())
+
+    assert sync_text == async_text == "caf\u00e9\nx\n"
+
+
+def test_load_manifest_streams_helm_stdout() -> None:
+    command = [
+        sys.executable,
+        "-c",
+        "print('apiVersion: v1\\nkind: ConfigMap\\nmetadata:\\n  name: streamed')",
+    ]
+
+    manifests = load_manifest(command)
+
+    assert manifests.get("configmap/streamed").metadata.name == "streamed"
+
+
+def test_load_manifest_renders_on_every_call(tmp_path) -> None:
+    values = tmp_path / "rendered.yaml"
+    values.write_text(
+        "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: before\n", encoding="utf-8"
+    )
+    command = [
+        sys.executable,
+        "-c",
+        f"print(open({str(values)!r}, encoding='utf-8').read())",
+    ]
+
+    assert load_manifest(command).get("configmap/before").metadata.name == "before"
+
+    values.write_text(
+        "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: after\n", encoding="utf-8"
+    )
 
-    with pytest.raises(HelmTemplateError, match="Helm command failed with exit code 1"):
-        load_manifest(["helm", "template", "."])
+    assert load_manifest(command).get("configmap/after").metadata.name == "after"
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import pytest_helm._plugin as plugin
+
+
+def _session(*, collectonly=False, no_helm_prefetch=False, **config_attrs):
+    option = SimpleNamespace(collectonly=collectonly, no_helm_prefetch=no_helm_prefetch)
+    config = SimpleNamespace(option=option, **config_attrs)
+    items = [
+        SimpleNamespace(fixturenames=["chart", "tmp_path"]),
+        SimpleNamespace(fixturenames=["prod_chart"]),
+    ]
+    return SimpleNamespace(config=config, items=items)
+
+
+@pytest.fixture
+def prefetched(monkeypatch) -> list[set[str]]:
+    calls: list[set[str]] = []
+    monkeypatch.setattr(plugin, "prefetch_manifests", lambda names: calls.append(set(names)))
+    return calls
+
+
+def test_collection_finish_prefetches_fixtures_of_collected_items(prefetched) -> None:
+    plugin.pytest_collection_finish(_session())
+
+    assert prefetched == [{"chart", "tmp_path", "prod_chart"}]
+
+
+@pytest.mark.parametrize(
+    "session",
+    [
+        _session(collectonly=True),
+        _session(no_helm_prefetch=True),
+        _session(workerinput={"workerid": "gw0"}),
+    ],
+    ids=["collect-only", "opt-out", "xdist-worker"],
+)
+def test_collection_finish_skips_prefetch(prefetched, session) -> None:
+    plugin.pytest_collection_finish(session)
+
+    assert prefetched == []
@@ -7,8 +7,7 @@ import pytest
 
 from pytest_helm import manifest_fixture
 
-pytest.importorskip("box")
-pytest.importorskip("ruamel.yaml")
+pytest.importorskip("yaml")
 
 if shutil.which("helm") is None:
     pytestmark = pytest.mark.skip(reason="helm binary not available")